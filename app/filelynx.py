@@ -1,9 +1,55 @@
 import os
-from datetime import datetime, date
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from utils import determine_type
+from utils import determine_type, fast_lower, split_suffix
 from typing import Optional, Literal, Generator, List
 
+_VALID_TYPES = frozenset({'file', 'folder'})
+_VALID_SORTS = frozenset({'name', 'datetime', 'size'})
+_VALID_GROUPINGS = frozenset({'ext', 'date'})
+
+
+def _name_key(row: tuple) -> str:
+    return split_suffix(row[0].name)[0].lower()
+
+
+def _datetime_key(row: tuple) -> float:
+    return row[1].st_mtime
+
+
+def _size_key(row: tuple) -> int:
+    return row[1].st_size
+
+
+# sort keys for rows starting with a (DirEntry, stat_result) pair
+_SORT_KEYS = {'name': _name_key, 'datetime': _datetime_key, 'size': _size_key}
+
+
+def _apply_renames(plan: list[tuple[str, str]]) -> None:
+    """Moves every source path in `plan` to its paired destination path.
+
+    Renames are independent syscalls, so they're dispatched to a thread pool to overlap filesystem latency. If any
+    destination is also the source of another rename, the plan is order-dependent and gets executed serially.
+
+    Raises:
+        OSError: if any of the renames failed (re-raised after all the other renames have finished).
+    """
+    # compared case-insensitively, the same as the collision checks, since on case-insensitive filesystems a
+    # destination differing from a source only by case still refers to the same file
+    sources = {src.lower() for src, _ in plan}
+    if any(dst.lower() in sources for _, dst in plan):
+        for src, dst in plan:
+            os.replace(src, dst)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        futures = [executor.submit(os.replace, src, dst) for src, dst in plan]
+    for future in futures:
+        future.result()
+
 
 class FileLynx:
     def __init__(self, cur_dir: str | Path):
@@ -66,38 +112,69 @@ class FileLynx:
             ValueError: if `type_filer` parameter contains items other than "file" or "folder";
                 if `sort_by` parameter is anything else than "name", "datetime" or "size"
         """
+        return [path for path, _, _ in self.ls_with_stat(type_filter, extension_filter, sort_by, ascending)]
+
+    def ls_with_stat(
+        self,
+        type_filter: Optional[list[str]] = None,
+        extension_filter: Optional[list[str]] = None,
+        sort_by: Optional[Literal['name', 'datetime', 'size'] | str] = None,
+        ascending: bool = True
+    ) -> list[tuple[Path, os.stat_result, str]]:
+        """Works like `ls`, but returns each child element together with its `stat_result` and type.
+
+        Every child is stat-ed exactly once, so callers that need modification times, sizes or types (e.g. to display
+        them) don't have to query the filesystem again.
+
+        Args:
+            type_filter: See `ls`.
+            extension_filter: See `ls`.
+            sort_by: See `ls`.
+            ascending: See `ls`.
+
+        Returns:
+            A sorted (and filtered) list of (Path, stat_result, type) tuples of current directory's children, where
+            type is one of "file", "folder" or "unknown".
+        Raises:
+            ValueError: if `type_filer` parameter contains items other than "file" or "folder";
+                if `sort_by` parameter is anything else than "name", "datetime" or "size"
+        """
         if type_filter:
-            type_filter = [tf.lower() for tf in type_filter]
+            type_filter = frozenset(fast_lower(tf) for tf in type_filter)
         if extension_filter:
-            extension_filter = [ef.lower() for ef in extension_filter]
+            extension_filter = frozenset(fast_lower(ef) for ef in extension_filter)
         if sort_by:
             sort_by = sort_by.lower()
 
-        if type_filter and not set(type_filter).issubset({'file', 'folder'}):
+        if type_filter and not _VALID_TYPES.issuperset(type_filter):
             raise ValueError('[type_filter] parameter contains invalid items. Must be one of: "file", "folder".')
-        if sort_by and sort_by not in ['name', 'datetime', 'size']:
+        if sort_by and sort_by not in _VALID_SORTS:
             raise ValueError(f'"{sort_by}" is not a valid sorting key. Must be one of: "name", "datetime", "size".')
 
-        if sort_by == 'name':
-            sort_key = lambda f: f.stem.lower()
-        elif sort_by == 'datetime':
-            sort_key = lambda f: f.stat().st_mtime
-        elif sort_by == 'size':
-            sort_key = lambda f: f.stat().st_size
-        else:
-            sort_key = lambda f: f.stem.lower()
-
-        sorted_ = sorted(self.cur_dir.iterdir(), key=sort_key, reverse=not ascending)
-
-        to_display = []
-        for child in sorted_:
-            type_ = determine_type(child)
-            if type_filter and type_ not in type_filter:
-                continue
-            if extension_filter and (child.suffix[1:].lower() not in extension_filter or child.suffix == ''):
-                continue
-            to_display.append(child)
-        return to_display
+        sort_key = _SORT_KEYS[sort_by] if sort_by else _name_key
+
+        rows = []
+        with os.scandir(self.cur_dir) as it:
+            for entry in it:
+                type_ = determine_type(entry)
+                if type_filter and type_ not in type_filter:
+                    continue
+                if extension_filter:
+                    suffix = split_suffix(entry.name)[1]
+                    if not suffix or fast_lower(suffix[1:]) not in extension_filter:
+                        continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # a dangling symlink is listed with its own metadata; an entry removed since the scan is skipped
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                rows.append((entry, stat, type_))
+        rows.sort(key=sort_key, reverse=not ascending)
+
+        return [(Path(entry.path), stat, type_) for entry, stat, type_ in rows]
 
     def subgroup(
             self,
@@ -125,45 +202,64 @@ class FileLynx:
         """
         if by:
             by = by.lower()
-        if ext_to_name_map:
-            ext_to_name_map = {k.lower(): v for k, v in ext_to_name_map.items()}
+        ext_to_name_map = {fast_lower(k): v for k, v in ext_to_name_map.items()} if ext_to_name_map else {}
 
-        if by not in ['ext', 'date']:
+        if by not in _VALID_GROUPINGS:
             raise ValueError('[by] parameter contains an invalid subgrouping condition.')
 
-        files = [f for f in self.cur_dir.iterdir() if f.is_file()]
-        subfolders = 0
+        with os.scandir(self.cur_dir) as it:
+            files = [entry for entry in it if determine_type(entry) == 'file']
 
         if by == 'ext':
-            for f in files:
-                # exists_count = 1
-                if ext_to_name_map and f.suffix[1:].lower() in ext_to_name_map:
-                    subfolder_name = ext_to_name_map[f.suffix[1:].lower()]
-                else:
-                    subfolder_name = f.suffix[1:].lower()
-
-                extension_dir = self.cur_dir / subfolder_name
-                if not extension_dir.exists():
-                    extension_dir.mkdir()
-                    subfolders += 1
-                new_path = extension_dir / f.name
-                if new_path.exists():
-                    new_path = new_path.with_stem(f'{new_path.stem} (1)')
-                    # exists_count += 1
-                f.replace(new_path)
+            grouped = []
+            for entry in files:
+                ext = fast_lower(split_suffix(entry.name)[1][1:])
+                grouped.append((entry, ext_to_name_map.get(ext, ext)))
 
         elif by == 'date':
-            for f in files:
-                subfolder_name = date.fromtimestamp(f.stat().st_mtime).strftime(dt_format)
-
-                extension_dir = self.cur_dir / subfolder_name
-                if not extension_dir.exists():
-                    extension_dir.mkdir()
-                    subfolders += 1
-                new_path = extension_dir / f.name
-                if new_path.exists():
-                    new_path = new_path.with_stem(f'{new_path.stem} (1)')
-                f.replace(new_path)
+            # files usually share a handful of modification days, so each day gets formatted only once
+            names_by_day = {}
+            grouped = []
+            for entry in files:
+                local_time = time.localtime(entry.stat().st_mtime)
+                day = local_time[:3]
+                subfolder_name = names_by_day.get(day)
+                if subfolder_name is None:
+                    # zeroed time fields, the same as date.strftime
+                    subfolder_name = time.strftime(dt_format, (*day, 0, 0, 0, *local_time[6:8], -1))
+                    names_by_day[day] = subfolder_name
+                grouped.append((entry, subfolder_name))
+
+        # every subfolder is created (or listed, if it already exists) once, instead of being checked per file;
+        # names are compared case-insensitively so nothing gets overwritten on case-insensitive filesystems
+        subfolders = 0
+        taken_names = {}
+        prefixes = {}
+        for subfolder_name in {subfolder_name for _, subfolder_name in grouped}:
+            subfolder = self.cur_dir / subfolder_name
+            try:
+                subfolder.mkdir()
+                subfolders += 1
+                taken_names[subfolder_name] = set()
+            except FileExistsError:
+                taken_names[subfolder_name] = {name.lower() for name in os.listdir(subfolder)}
+            prefixes[subfolder_name] = os.path.join(subfolder, '')
+
+        plan = []
+        for entry, subfolder_name in grouped:
+            taken = taken_names[subfolder_name]
+            new_name = entry.name
+            if new_name.lower() in taken:
+                stem, suffix = split_suffix(new_name)
+                exists_counter = 1
+                new_name = f'{stem} ({exists_counter}){suffix}'
+                while new_name.lower() in taken:
+                    exists_counter += 1
+                    new_name = f'{stem} ({exists_counter}){suffix}'
+            taken.add(new_name.lower())
+            plan.append((entry.path, f'{prefixes[subfolder_name]}{new_name}'))
+
+        _apply_renames(plan)
 
         return subfolders
 
@@ -209,64 +305,68 @@ class FileLynx:
         Raises:
             ValueError: if `before` argument is an earlier datetime than `after`;
                 if `sort_by` is anything else than "name", "datetime" or "size";
-                if `numerator_start` is less than zero
+                if `numerator_start` is less than zero;
+                if `new_name` or `sep` contains a path separator
         """
         if extension_filter:
-            extension_filter = [ef.lower() for ef in extension_filter]
+            extension_filter = frozenset(fast_lower(ef) for ef in extension_filter)
         if sort_by:
             sort_by = sort_by.lower()
 
         if after > before:
             raise ValueError('[before] argument can\'t be less than [after].')
-        if sort_by and sort_by.lower() not in ['name', 'datetime', 'size']:
+        if sort_by and sort_by not in _VALID_SORTS:
             raise ValueError('[sort_by] argument contains an invalid sorting key.')
         if numerator_start < 0:
             raise ValueError('[numerator_start] cannot be below zero.')
+        if any(s in new_name + sep for s in (os.sep, os.altsep) if s):
+            raise ValueError('[new_name] and [sep] arguments cannot contain path separators.')
 
         filtered = []
-        for f in self.cur_dir.iterdir():
-            if not f.is_file():
-                continue
-            if extension_filter and f.suffix[1:].lower() not in extension_filter:
-                continue
-            f_mtime = datetime.fromtimestamp(f.stat().st_mtime)
-            if f_mtime < after or f_mtime > before:
-                continue
-            filtered.append(f)
-
-        sort_key = None
+        with os.scandir(self.cur_dir) as it:
+            for entry in it:
+                if determine_type(entry) != 'file':
+                    continue
+                if extension_filter and fast_lower(split_suffix(entry.name)[1][1:]) not in extension_filter:
+                    continue
+                stat = entry.stat()
+                f_mtime = datetime.fromtimestamp(stat.st_mtime)
+                if f_mtime < after or f_mtime > before:
+                    continue
+                filtered.append((entry, stat))
+
         if sort_by:
-            sort_by = sort_by.lower()
-        if sort_by == 'name':
-            sort_key = lambda f: f.stem.lower()
-        elif sort_by == 'datetime':
-            sort_key = lambda f: f.stat().st_mtime
-        elif sort_by == 'size':
-            sort_key = lambda f: f.stat().st_size
-
-        if sort_key:
-            filtered_sorted = sorted(filtered, key=sort_key, reverse=not ascending)
+            filtered_sorted = sorted(filtered, key=_SORT_KEYS[sort_by], reverse=not ascending)
         else:
             filtered_sorted = filtered
 
-        counter = 0
+        plan = []
+        cur_dir = os.fspath(self.cur_dir)
+        # targets are built by plain concatenation with the directory prefix (which ends with a separator)
+        prefix = os.path.join(cur_dir, '')
+        # names are compared case-insensitively so nothing gets overwritten on case-insensitive filesystems
+        existing = Counter(name.lower() for name in os.listdir(cur_dir))
 
         numerator = numerator_start
         exists_counter = 1
-        for f in filtered_sorted:
+        for entry, _ in filtered_sorted:
+            suffix = split_suffix(entry.name)[1]
             if numerator_first:
                 new_name_stem = '{}{}{}'.format(str(numerator).zfill(zero_pad), sep, new_name)
             else:
                 new_name_stem = '{}{}{}'.format(new_name, sep, str(numerator).zfill(zero_pad))
-            new_path = f.with_stem(new_name_stem)
-            while new_path.exists():
-                new_path = new_path.with_stem(f'{new_name_stem} ({exists_counter})')
+            candidate = f'{new_name_stem}{suffix}'
+            while existing[candidate.lower()]:
+                candidate = f'{new_name_stem} ({exists_counter}){suffix}'
                 exists_counter += 1
-            f.rename(new_path)
+            existing[candidate.lower()] += 1
+            existing[entry.name.lower()] -= 1
+            plan.append((entry.path, f'{prefix}{candidate}'))
             numerator += 1
-            counter += 1
 
-        return counter
+        _apply_renames(plan)
+
+        return len(plan)
 
 
 if __name__ == '__main__':
@@ -2,12 +2,12 @@ import os
 import platform
 from datetime import datetime
 import re
+import time
 import typer
 from rich.console import Console
 from rich.table import Table
-import datetime as dt
 from filelynx import FileLynx
-from utils import determine_type
+from utils import fast_lower
 from helptext import HelpText
 from typing import Annotated, Optional
 from enum import StrEnum
@@ -19,41 +19,55 @@ app = typer.Typer(no_args_is_help=True,
                   epilog='Made with :heart: by [jlynxdev](https://github.com/jlynxdev)')
 console = Console()
 err_console = Console(stderr=True)
-filelynx = FileLynx(os.getcwd())
+_filelynx: FileLynx | None = None
 
 
 def get_cwd() -> str:
     return os.getcwd()
 
 
+def _get_fl() -> FileLynx:
+    """Returns the shared FileLynx instance, creating it on first use so --help and --version don't touch the disk."""
+    global _filelynx
+    if _filelynx is None:
+        _filelynx = FileLynx(os.getcwd())
+    return _filelynx
+
+
+_SHOW_DT_FORMAT = '%d/%m/%Y, %H:%M:%S'
+_IS_WINDOWS = platform.system() == 'Windows'
+_DATE_WILDCARDS = str.maketrans({'D': '%d', 'M': '%m', 'y': '%y', 'Y': '%Y'})
+_DAY_RE = re.compile('(?<!%)(?<!%-)(?<!%#)d')
+_MONTH_RE = re.compile('(?<!%)(?<!%-)(?<!%#)m')
+_MAPPING_RE = re.compile(r'[^>]+?>[^>]+')
+_EXTENSIONS_RE = re.compile(r'[a-z0-9]+(?:,[a-z0-9]+)*')
+_DATE_FORMAT_RE = re.compile(r'[\w\s\.-]+')
+
+
 def _convert_date_format(orig: str) -> str:
     cnv = orig.replace('month', '%b')
     cnv = cnv.replace('Month', '%B')
-    cnv = cnv.replace('D', '%d')
-    cnv = cnv.replace('M', '%m')
-    cnv = cnv.replace('y', '%y')
-    cnv = cnv.replace('Y', '%Y')
-    if platform.system() == 'Windows':
-        cnv = re.sub('(?<!%)(?<!%-)(?<!%#)d', '%#d', cnv)
-        cnv = re.sub('(?<!%)(?<!%-)(?<!%#)m', '%#m', cnv)
+    cnv = cnv.translate(_DATE_WILDCARDS)
+    if _IS_WINDOWS:
+        cnv = _DAY_RE.sub('%#d', cnv)
+        cnv = _MONTH_RE.sub('%#m', cnv)
     else:
-        cnv = re.sub('(?<!%)(?<!%-)(?<!%#)d', '%-d', cnv)
-        cnv = re.sub('(?<!%)(?<!%-)(?<!%#)m', '%-m', cnv)
+        cnv = _DAY_RE.sub('%-d', cnv)
+        cnv = _MONTH_RE.sub('%-m', cnv)
     return cnv
 
 
 def _convert_extensions_arg(extensions: str) -> list[str]:
     extension_filter = extensions.split(',')
-    extension_filter = [ext.strip().lower() for ext in extension_filter]
+    extension_filter = [fast_lower(ext.strip()) for ext in extension_filter]
     return extension_filter
 
 
 def validate_mappings(mappings: list[str] | None) -> list[str] | None:
     if mappings is None or len(mappings) == 0:
         return mappings
-    pattern = re.compile(r'^[^>]+?>[^>]+$')
     for mapping in mappings:
-        if not pattern.match(mapping):
+        if not _MAPPING_RE.fullmatch(mapping):
             raise typer.BadParameter(f'Mapping "{mapping}" has a wrong format. Must be [extension>folder_name]')
     return mappings
 
@@ -61,7 +75,7 @@ def validate_mappings(mappings: list[str] | None) -> list[str] | None:
 def validate_extensions(extensions: str | None) -> str | None:
     if extensions is None:
         return None
-    if re.search(r'^[a-z0-9]+?(?:,[a-z0-9]+?)*$', extensions.lower()):
+    if _EXTENSIONS_RE.fullmatch(fast_lower(extensions)):
         return extensions
     else:
         raise typer.BadParameter(f'Value "{extensions}" has a wrong format. '
@@ -71,7 +85,7 @@ def validate_extensions(extensions: str | None) -> str | None:
 def validate_date_format(date_format: str) -> str | None:
     if date_format is None:
         return None
-    if re.search(r'^[\w\s\.-]+$', date_format):
+    if _DATE_FORMAT_RE.fullmatch(date_format):
         return date_format
     else:
         raise typer.BadParameter(f'Value "{date_format}" has a wrong format. '
@@ -111,6 +125,7 @@ def show(
     """
     Displays the contents of the current working directory.
     """
+    filelynx = _get_fl()
     if dir_ is None:
         filelynx.update_cwd()
     else:
@@ -128,18 +143,17 @@ def show(
 
     extension_filter = _convert_extensions_arg(extensions) if extensions else None
 
-    children = filelynx.ls(type_filter=type_filter, extension_filter=extension_filter, sort_by=sort_by,
-                           ascending=not desc)
+    children = filelynx.ls_with_stat(type_filter=type_filter, extension_filter=extension_filter, sort_by=sort_by,
+                                     ascending=not desc)
 
+    rows = [
+        (child.name, type_, time.strftime(_SHOW_DT_FORMAT, time.localtime(stat.st_mtime)),
+         str(stat.st_size), fast_lower(child.suffix))
+        for child, stat, type_ in children
+    ]
     table = Table('Name', 'Type', 'Modified', 'Size', 'Extension')
-    for child in children:
-        name = child.name
-        type_ = determine_type(child)
-        mod = child.stat().st_mtime
-        mod = dt.datetime.fromtimestamp(mod).strftime('%d/%m/%Y, %H:%M:%S')
-        size = child.stat().st_size
-        extension = child.suffix.lower()
-        table.add_row(name, type_, mod, str(size), extension)
+    for row in rows:
+        table.add_row(*row)
     console.print(table)
 
 
@@ -185,6 +199,7 @@ def group_by(
     - Y - full year
 
     """
+    filelynx = _get_fl()
     filelynx.update_cwd()
 
     if ext_to_name_map is None:
@@ -193,7 +208,7 @@ def group_by(
         map_ = dict()
         for mapping in ext_to_name_map:
             extension, folder_name = mapping.split('>')
-            map_[extension.strip().lower()] = folder_name.strip()
+            map_[fast_lower(extension.strip())] = folder_name.strip()
 
     date_format = _convert_date_format(date_format)
 
@@ -250,6 +265,7 @@ def batch_rename(
 
     The resulting filenames will look something like: "{NAME}{SEP}{NUMERATOR}" or "{NUMERATOR}{SEP}{NAME}".
     """
+    filelynx = _get_fl()
     filelynx.update_cwd()
 
     extension_filter = _convert_extensions_arg(extensions) if extensions else None
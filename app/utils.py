@@ -1,9 +1,46 @@
+import os
+import stat
 from pathlib import Path
 
 
-def determine_type(path: Path) -> str:
-    if path.is_dir():
+def determine_type(path: Path | os.DirEntry) -> str:
+    if isinstance(path, os.DirEntry):
+        # DirEntry usually answers from the metadata cached by the directory scan, but for a symlink it has to follow
+        # the link, which can fail (e.g. a symlink loop) - such entries are 'unknown', the same as for a Path
+        try:
+            if path.is_dir():
+                return 'folder'
+            if path.is_file():
+                return 'file'
+        except OSError:
+            pass
+        return 'unknown'
+
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        return 'unknown'
+    if stat.S_ISDIR(mode):
         return 'folder'
-    if path.is_file():
+    if stat.S_ISREG(mode):
         return 'file'
     return 'unknown'
+
+
+def fast_lower(s: str) -> str:
+    """Returns a lowercase version of `s`, skipping the copy if `s` is already lowercase ASCII."""
+    if s.isascii() and s.islower():
+        return s
+    return s.lower()
+
+
+def split_suffix(name: str) -> tuple[str, str]:
+    """Splits a file name into its stem and suffix, following the same rules as `PurePath.stem` and `PurePath.suffix`.
+
+    Unlike `os.path.splitext`, a name ending with a dot (e.g. "bar.") has no suffix, while a name made of only leading
+    dots and an extension (e.g. "..foo") does.
+    """
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
@@ -0,0 +1,25 @@
+import os
+import sys
+import tempfile
+
+_NOT_SET = object()
+_previous_tempdir = _NOT_SET
+
+
+def pytest_configure(config):
+    # The tests are dominated by file metadata operations, so on Linux their temporary directories are put in the
+    # memory-backed /dev/shm. An explicit --basetemp or TMPDIR still takes precedence.
+    global _previous_tempdir
+    if config.option.basetemp or 'TMPDIR' in os.environ:
+        return
+    if sys.platform == 'linux' and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        _previous_tempdir = tempfile.tempdir
+        tempfile.tempdir = '/dev/shm'
+
+
+def pytest_unconfigure(config):
+    # tempfile.tempdir is process-wide, so the previous value is restored for anything running after the session
+    global _previous_tempdir
+    if _previous_tempdir is not _NOT_SET:
+        tempfile.tempdir = _previous_tempdir
+        _previous_tempdir = _NOT_SET
@@ -1,4 +1,8 @@
 import os
+import re
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date, datetime
 
@@ -7,50 +11,60 @@ import pytest
 from app.filelynx import FileLynx
 
 
-@pytest.fixture()
-def temp_file_dir(tmp_path):
-    _make_dummy_file(tmp_path, 'aac', 'txt', 4123)
-    _make_dummy_file(tmp_path, 'abc', 'txt', 6123)
-    _make_dummy_file(tmp_path, 'klm', 'txt', 23)
+# (name, extension, size, type) of every entry in the test directory tree
+_DIR_META = (
+    ('aac', 'txt', 4123, 'file'),
+    ('abc', 'txt', 6123, 'file'),
+    ('klm', 'txt', 23, 'file'),
+    ('image1', 'jpg', 2884, 'file'),
+    ('some-img', 'jpg', 300, 'file'),
+    ('another', 'jpg', 4123, 'file'),
+    ('docu', 'pdf', 1000, 'file'),
+    ('invoice', 'pdf', 23, 'file'),
+    ('docu2', 'pdf', 23705, 'file'),
+    ('sub', '', 0, 'folder'),
+    ('Downloads', '', 0, 'folder'),
+    ('Books', '', 0, 'folder'),
+)
+_NAMES_SORTED_CI = tuple(sorted((m[0] for m in _DIR_META), key=str.lower))
+_FILE_NAMES = frozenset(m[0] for m in _DIR_META if m[3] == 'file')
+_FOLDER_NAMES = frozenset(m[0] for m in _DIR_META if m[3] == 'folder')
+_EXTS = frozenset(m[1] for m in _DIR_META if m[3] == 'file')
+
+
+@pytest.fixture(scope='session')
+def _prototype_dir(tmp_path_factory):
+    """Builds the test directory tree once per session. Tests must not modify it - see `temp_file_dir`."""
+    base_path = tmp_path_factory.mktemp('prototype')
+    _bulk_make_files(base_path, [(m[0], m[1], m[2]) for m in _DIR_META if m[3] == 'file'])
+    _bulk_make_folders(base_path, [m[0] for m in _DIR_META if m[3] == 'folder'])
+    yield base_path
+
 
-    _make_dummy_file(tmp_path, 'image1', 'jpg', 2884)
-    _make_dummy_file(tmp_path, 'some-img', 'jpg', 300)
-    _make_dummy_file(tmp_path, 'another', 'jpg', 4123)
+@pytest.fixture()
+def temp_file_dir(_prototype_dir, tmp_path):
+    """A private copy of the prototype tree which tests are free to modify. Files are hardlinked, not copied."""
+    dir_copy = tmp_path / 'files'
+    shutil.copytree(_prototype_dir, dir_copy, copy_function=os.link)
+    yield dir_copy
 
-    _make_dummy_file(tmp_path, 'docu', 'pdf', 1000)
-    _make_dummy_file(tmp_path, 'invoice', 'pdf', 23)
-    _make_dummy_file(tmp_path, 'docu2', 'pdf', 23705)
 
-    _make_dummy_folder(tmp_path, 'sub')
-    _make_dummy_folder(tmp_path, 'Downloads')
-    _make_dummy_folder(tmp_path, 'Books')
-    yield tmp_path
+@pytest.fixture()
+def sut(temp_file_dir):
+    yield FileLynx(temp_file_dir)
 
 
 @pytest.fixture()
 def temp_dir_meta():
     """
     Returns:
-        A list of tuples with the following indices
+        A tuple of tuples with the following indices
             0 - name,
             1 - extension,
             2 - size,
             3 - type
     """
-    yield [
-        ('aac', 'txt', 4123, 'file'),
-        ('abc', 'txt', 6123, 'file'),
-        ('klm', 'txt', 23, 'file'),
-        ('image1', 'jpg', 2884, 'file'),
-        ('some-img', 'jpg', 300, 'file'),
-        ('another', 'jpg', 4123, 'file'),
-        ('docu', 'pdf', 1000, 'file'),
-        ('invoice', 'pdf', 23, 'file'),
-        ('docu2', 'pdf', 23705, 'file'),
-        ('sub', '', 0, 'folder'),
-        ('Downloads', '', 0, 'folder'),
-        ('Books', '', 0, 'folder'),
-    ]
+    yield _DIR_META
 
 
 class TestFileLynxInit:
@@ -65,63 +79,44 @@ class TestFileLynxInit:
 
     @pytest.mark.parametrize('nonexistent_path',
                              ['./fjieoajiidoihg', 'aefae8s', './oapd/fiswre', Path('./argaerh'), Path('nslgn')])
-    def test_constructor_should_raise_when_path_not_exists(self, nonexistent_path, temp_file_dir):
-        # given
-        sut = FileLynx(temp_file_dir)
-
-        # when
-        with pytest.raises(ValueError) as exc_info:
+    def test_constructor_should_raise_when_path_not_exists(self, nonexistent_path, sut):
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[new_dir] argument is not an existing path')):
             sut.set_dir(nonexistent_path)
 
-        # then
-        assert '[new_dir] argument is not an existing path' in exc_info.value.args[0]
-
-    def test_constructor_should_raise_when_path_is_not_dir(self, temp_file_dir, file_path):
-        # given
-        sut = FileLynx(temp_file_dir)
-
-        # when
-        with pytest.raises(ValueError) as exc_info:
+    def test_constructor_should_raise_when_path_is_not_dir(self, sut, file_path):
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[new_dir] argument is not a directory')):
             sut.set_dir(file_path)
 
-        # then
-        assert '[new_dir] argument is not a directory' in exc_info.value.args[0]
-
 
 class TestFileLynxLs:
 
-    @pytest.mark.parametrize('type_filter', [['sth'], ['sth', 'abc'], ['file', 'aabb']])
-    def test_ls_should_raise_when_type_filter_is_wrong(self, type_filter, temp_file_dir):
-        # given
-        sut = FileLynx(temp_file_dir)
-
-        # when
-        with pytest.raises(ValueError) as exc_info:
-            actual = sut.ls(type_filter=type_filter)
+    @pytest.fixture()
+    def temp_file_dir(self, _prototype_dir):
+        # ls() doesn't modify the directory, so the shared prototype can be used as-is
+        contents_before = sorted(os.listdir(_prototype_dir))
+        yield _prototype_dir
+        assert sorted(os.listdir(_prototype_dir)) == contents_before, 'the shared prototype directory was modified'
 
-        # then
-        assert '[type_filter] parameter contains invalid items. Must be one of: "file", "folder"' in \
-               exc_info.value.args[0]
+    @pytest.mark.parametrize('type_filter', [['sth'], ['sth', 'abc'], ['file', 'aabb']])
+    def test_ls_should_raise_when_type_filter_is_wrong(self, type_filter, sut):
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[type_filter] parameter contains invalid items. '
+                                                       'Must be one of: "file", "folder"')):
+            sut.ls(type_filter=type_filter)
 
     @pytest.mark.parametrize('sort_by', ['hello', 'abc'])
-    def test_ls_should_raise_when_sort_by_is_wrong(self, sort_by, temp_file_dir):
-        # given
-        sut = FileLynx(temp_file_dir)
-
-        # when
-        with pytest.raises(ValueError) as exc_info:
-            actual = sut.ls(sort_by=sort_by)
+    def test_ls_should_raise_when_sort_by_is_wrong(self, sort_by, sut):
+        # when / then
+        with pytest.raises(ValueError, match=re.escape(f'"{sort_by}" is not a valid sorting key. '
+                                                       f'Must be one of: "name", "datetime", "size"')):
+            sut.ls(sort_by=sort_by)
 
-        # then
-        assert f'"{sort_by}" is not a valid sorting key. Must be one of: "name", "datetime", "size"' in \
-               exc_info.value.args[0]
-
-    def test_ls_should_return_default_order_when_no_params_given(self, temp_file_dir, temp_dir_meta):
+    def test_ls_should_return_default_order_when_no_params_given(self, sut, temp_dir_meta):
         # given
-        sut = FileLynx(temp_file_dir)
         expected_len = len(temp_dir_meta)
-        expected_name_order = sorted([m[0] for m in temp_dir_meta],
-                                     key=lambda f: f.lower())
+        expected_name_order = _NAMES_SORTED_CI
 
         # when
         actual = sut.ls()
@@ -129,65 +124,58 @@ class TestFileLynxLs:
         # then
         assert isinstance(actual, list)
         assert len(actual) == expected_len
-        for expected, elem in zip(expected_name_order, actual):
-            assert expected == elem.stem
+        assert [elem.stem for elem in actual] == list(expected_name_order)
 
-    @pytest.mark.parametrize("folder_filter", [['folder'], ['Folder'], ['foLDeR']])
-    def test_ls_should_return_only_folders_when_type_filter_is_folder(self, temp_file_dir, temp_dir_meta,
-                                                                      folder_filter):
+    @pytest.mark.parametrize("folder_filter", [[s] for s in ('folder', 'Folder', 'foLDeR')],
+                             ids=['lower', 'title', 'mixed'])
+    def test_ls_should_return_only_folders_when_type_filter_is_folder(self, sut, folder_filter):
         # given
-        sut = FileLynx(temp_file_dir)
-        expected = [m[0] for m in temp_dir_meta if m[3] == 'folder']
+        expected = _FOLDER_NAMES
 
         # when
         actual = sut.ls(type_filter=folder_filter)
 
         # then
-        names = set(map(lambda f: f.stem, actual))
+        names = {f.stem for f in actual}
         assert len(expected) == len(actual)
-        assert set(expected).issubset(names)
-        assert names.issubset(set(expected))
+        assert names == expected
         for elem in actual:
             assert elem.is_dir()
 
-    @pytest.mark.parametrize("file_filter", [['file'], ['File'], ['fILE']])
-    def test_ls_should_return_only_files_when_type_filter_is_file(self, temp_file_dir, temp_dir_meta, file_filter):
+    @pytest.mark.parametrize("file_filter", [[s] for s in ('file', 'File', 'fILE')], ids=['lower', 'title', 'mixed'])
+    def test_ls_should_return_only_files_when_type_filter_is_file(self, sut, file_filter):
         # given
-        sut = FileLynx(temp_file_dir)
-        expected = [m[0] for m in temp_dir_meta if m[3] == 'file']
+        expected = _FILE_NAMES
 
         # when
         actual = sut.ls(type_filter=file_filter)
 
         # then
-        names = set(map(lambda f: f.stem, actual))
+        names = {f.stem for f in actual}
         assert len(expected) == len(actual)
-        assert set(expected).issubset(names)
-        assert names.issubset(set(expected))
+        assert names == expected
         for elem in actual:
             assert elem.is_file()
 
-    @pytest.mark.parametrize("type_filter", [['file', 'folder'], ['File', 'Folder'], ['fILE', 'fOLdER']])
-    def test_ls_should_return_all_when_type_filter_is_all(self, temp_file_dir, temp_dir_meta, type_filter):
+    @pytest.mark.parametrize("type_filter", [['file', 'folder'], ['File', 'Folder'], ['fILE', 'fOLdER']],
+                             ids=['lower', 'title', 'mixed'])
+    def test_ls_should_return_all_when_type_filter_is_all(self, sut, temp_dir_meta, type_filter):
         # given
-        sut = FileLynx(temp_file_dir)
         expected = [m[0] for m in temp_dir_meta]
 
         # when
         actual = sut.ls(type_filter=type_filter)
 
         # then
-        names = set(map(lambda f: f.stem, actual))
+        names = {f.stem for f in actual}
         assert len(expected) == len(actual)
-        assert set(expected).issubset(names)
-        assert names.issubset(set(expected))
+        assert names == frozenset(expected)
 
     @pytest.mark.parametrize('extension_filter', [['txT'], ['jpg', 'pDF', 'sthelse'], ['txt', 'Jpg', 'PDF', '']])
-    def test_ls_should_return_only_specified_extensions(self, temp_file_dir, temp_dir_meta, extension_filter):
+    def test_ls_should_return_only_specified_extensions(self, sut, extension_filter):
         # given
-        sut = FileLynx(temp_file_dir)
-        expected_extensions = [e.lower() for e in extension_filter]
-        expected_len = len([m for m in temp_dir_meta if m[1] in expected_extensions and m[3] != 'folder'])
+        expected_extensions = frozenset(e.lower() for e in extension_filter)
+        expected_len = sum(1 for m in _DIR_META if m[3] == 'file' and m[1] in expected_extensions)
 
         # when
         actual = sut.ls(extension_filter=extension_filter)
@@ -195,30 +183,25 @@ class TestFileLynxLs:
         # then
         for elem in actual:
             assert elem.is_file()
-            assert elem.suffix[1:] in expected_extensions
+            _, dot_ext = os.path.splitext(elem.name)
+            assert dot_ext[1:].lower() in expected_extensions
         assert len(actual) == expected_len
 
     @pytest.mark.parametrize("sort_by_name,ascending", [('nAMe', True), ('name', False)])
-    def test_ls_should_return_sorted_by_name_when_sort_by_name(self, sort_by_name, ascending,
-                                                               temp_file_dir, temp_dir_meta):
+    def test_ls_should_return_sorted_by_name_when_sort_by_name(self, sort_by_name, ascending, sut):
         # given
-        sut = FileLynx(temp_file_dir)
-        expected = sorted([m[0] for m in temp_dir_meta],
-                          key=lambda name: name.lower(), reverse=not ascending)
+        expected = _NAMES_SORTED_CI if ascending else _NAMES_SORTED_CI[::-1]
 
         # when
         actual = sut.ls(sort_by=sort_by_name, ascending=ascending)
 
         # then
-        assert len(expected) == len(actual)
-        for e, a in zip(expected, actual):
-            assert e == a.stem
+        assert [a.stem for a in actual] == list(expected)
 
     @pytest.mark.parametrize("sort_by_size,ascending", [('siZe', True), ('size', False)])
     def test_ls_should_return_sorted_by_size_when_sort_by_size(self, sort_by_size, ascending,
-                                                               temp_file_dir, temp_dir_meta):
+                                                               sut, temp_dir_meta):
         # given
-        sut = FileLynx(temp_file_dir)
         expected = sorted(temp_dir_meta, key=lambda elem: elem[2], reverse=not ascending)
 
         # when
@@ -231,19 +214,67 @@ class TestFileLynxLs:
 
     @pytest.mark.parametrize("sort_by_datetime,ascending", [('datetIMe', True), ('datetime', False)])
     def test_ls_should_return_sorted_by_datetime_when_sort_by_datetime(self, sort_by_datetime, ascending,
-                                                                       temp_file_dir, temp_dir_meta):
+                                                                       sut, temp_dir_meta):
+        # when
+        output = sut.ls(sort_by=sort_by_datetime, ascending=ascending)
+
+        # then
+        mtimes = [path.stat().st_mtime for path in output]
+        if ascending:
+            assert all(mtimes[i] <= mtimes[i + 1] for i in range(len(mtimes) - 1))
+        else:
+            assert all(mtimes[i] >= mtimes[i + 1] for i in range(len(mtimes) - 1))
+
+    def test_ls_with_stat_should_return_paths_with_their_stat_and_type(self, sut, temp_dir_meta):
         # given
-        sut = FileLynx(temp_file_dir)
+        expected_sizes = {m[0]: m[2] for m in temp_dir_meta if m[3] == 'file'}
 
         # when
-        output = sut.ls(sort_by=sort_by_datetime, ascending=ascending)
+        actual = sut.ls_with_stat(type_filter=['file'])
+
+        # then
+        assert [path for path, _, _ in actual] == sut.ls(type_filter=['file'])
+        for path, stat, type_ in actual:
+            assert expected_sizes[path.stem] == stat.st_size
+            assert type_ == 'file'
+
+    @pytest.mark.parametrize('extension_filter,expected_names', [(['foo'], ['..foo']), ([''], [])])
+    def test_ls_should_treat_extensions_like_path_suffix(self, tmp_path, extension_filter, expected_names):
+        # given
+        (tmp_path / '..foo').write_text('')
+        (tmp_path / 'bar.').write_text('')
+        sut = FileLynx(tmp_path)
+
+        # when
+        actual = sut.ls(extension_filter=extension_filter)
+
+        # then
+        assert [path.name for path in actual] == expected_names
+
+    def test_ls_should_list_dangling_symlink(self, tmp_path):
+        # given
+        (tmp_path / 'a.txt').write_text('a')
+        _make_symlink_or_skip(tmp_path / 'missing.txt', tmp_path / 'link.txt')
+        sut = FileLynx(tmp_path)
+
+        # when
+        actual = sut.ls()
+
+        # then
+        assert actual == [tmp_path / 'a.txt', tmp_path / 'link.txt']
+
+    def test_ls_should_list_symlink_loop(self, tmp_path):
+        # given
+        (tmp_path / 'a.txt').write_text('a')
+        _make_symlink_or_skip(tmp_path / 'self', tmp_path / 'self')
+        sut = FileLynx(tmp_path)
+
+        # when
+        actual = sut.ls_with_stat()
 
         # then
-        for i in range(len(output) - 1):
-            if ascending:
-                assert output[i].stat().st_mtime <= output[i + 1].stat().st_mtime
-            else:
-                assert output[i].stat().st_mtime >= output[i + 1].stat().st_mtime
+        assert [(path, type_) for path, _, type_ in actual] == [(tmp_path / 'a.txt', 'file'),
+                                                                (tmp_path / 'self', 'unknown')]
 
 
 class TestFileLynxSubgroup:
@@ -253,56 +284,48 @@ class TestFileLynxSubgroup:
         # given
         sut = FileLynx(temp_file_dir)
 
-        # when
-        with pytest.raises(ValueError) as exc_info:
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[by] parameter contains an invalid subgrouping condition')):
             sut.subgroup(by)
 
-        # then
-        assert '[by] parameter contains an invalid subgrouping condition' in exc_info.value.args[0]
-
-    @pytest.mark.parametrize('by_ext', ['ext', 'EXT', 'exT'])
-    def test_subgroup_should_group_by_extension_when_by_is_ext(self, by_ext, temp_file_dir, temp_dir_meta):
+    @pytest.mark.parametrize('by_ext', ['ext', 'EXT', 'exT'], ids=['lower', 'upper', 'mixed'])
+    def test_subgroup_should_group_by_extension_when_by_is_ext(self, by_ext, temp_file_dir):
         # given
         sut = FileLynx(temp_file_dir)
-        expected_contents = ([m[1] for m in temp_dir_meta if m[3] == 'file'] +
-                             [m[0] for m in temp_dir_meta if m[3] == 'folder'])
-        expected_num = len(set(m[1] for m in temp_dir_meta if m[3] == 'file'))
+        expected_contents = _EXTS | _FOLDER_NAMES
+        expected_num = len(_EXTS)
 
         # when
         actual_num = sut.subgroup(by_ext)
 
         # then
         assert expected_num == actual_num
-        children = list(temp_file_dir.iterdir())
-        children_names = [child.stem for child in children]
-        assert set(children_names).issubset(set(expected_contents))
-        assert set(expected_contents).issubset(set(children_names))
-        for child in children:
-            assert child.is_dir()
+        children = _snapshot(temp_file_dir)
+        assert {os.path.splitext(name)[0] for name, _, _ in children} == expected_contents
+        for _, _, is_dir in children:
+            assert is_dir
 
-    def test_subgroup_should_name_folders_correctly_when_map_given(self, temp_file_dir, temp_dir_meta):
+    def test_subgroup_should_name_folders_correctly_when_map_given(self, temp_file_dir):
         # given
         ext_to_name_map = {'tXT': 'Texts', 'jPg': 'Images', 'dummyext': 'somename'}
         sut = FileLynx(temp_file_dir)
         expected_folder_names = {'Texts', 'Images', 'pdf', 'sub', 'Downloads', 'Books'}
-        expected_num = len(set(m[1] for m in temp_dir_meta if m[3] == 'file'))
+        expected_num = len(_EXTS)
 
         # when
         actual_num = sut.subgroup('ext', ext_to_name_map=ext_to_name_map)
 
         # then
         assert expected_num == actual_num
-        contents = set(child.name for child in temp_file_dir.iterdir())
-        assert expected_folder_names.issubset(contents)
-        assert contents.issubset(expected_folder_names)
+        contents = {name for name, _, _ in _snapshot(temp_file_dir)}
+        assert contents == expected_folder_names
 
-    @pytest.mark.parametrize('by_date', ['date', 'DATE', 'DAte'])
-    def test_subgroup_should_group_by_date_when_by_is_date(self, by_date, temp_file_dir, temp_dir_meta):
+    @pytest.mark.parametrize('by_date', ['date', 'DATE', 'DAte'], ids=['lower', 'upper', 'mixed'])
+    def test_subgroup_should_group_by_date_when_by_is_date(self, by_date, temp_file_dir):
         # given
         sut = FileLynx(temp_file_dir)
         new_folder_name = date.today().strftime('%d-%m-%Y')
-        expected_folder_names = set(c[0] for c in temp_dir_meta if c[3] == 'folder')
-        expected_folder_names.add(new_folder_name)
+        expected_folder_names = _FOLDER_NAMES | {new_folder_name}
         expected_num = 1
 
         # when
@@ -310,17 +333,15 @@ class TestFileLynxSubgroup:
 
         # then
         assert expected_num == actual_num
-        actual_names = set(child.name for child in temp_file_dir.iterdir() if child.is_dir())
-        assert expected_folder_names.issubset(actual_names)
-        assert actual_names.issubset(expected_folder_names)
+        actual_names = {name for name, _, is_dir in _snapshot(temp_file_dir) if is_dir}
+        assert actual_names == expected_folder_names
 
     @pytest.mark.parametrize('dt_format', ['%m.%d.%y', '%d_%b_%Y', '%Y-%B-%d'])
-    def test_subgroup_should_format_folder_name_when_dt_format_is_given(self, dt_format, temp_file_dir, temp_dir_meta):
+    def test_subgroup_should_format_folder_name_when_dt_format_is_given(self, dt_format, temp_file_dir):
         # given
         sut = FileLynx(temp_file_dir)
         new_folder_name = date.today().strftime(dt_format)
-        expected_folder_names = set(c[0] for c in temp_dir_meta if c[3] == 'folder')
-        expected_folder_names.add(new_folder_name)
+        expected_folder_names = _FOLDER_NAMES | {new_folder_name}
         expected_num = 1
 
         # when
@@ -328,9 +349,41 @@ class TestFileLynxSubgroup:
 
         # then
         assert expected_num == actual_num
-        actual_names = set(child.name for child in temp_file_dir.iterdir() if child.is_dir())
-        assert expected_folder_names.issubset(actual_names)
-        assert actual_names.issubset(expected_folder_names)
+        actual_names = {name for name, _, is_dir in _snapshot(temp_file_dir) if is_dir}
+        assert actual_names == expected_folder_names
+
+    def test_subgroup_should_not_overwrite_files_in_existing_subfolder(self, tmp_path):
+        # given
+        (tmp_path / 'txt').mkdir()
+        (tmp_path / 'txt' / 'a.txt').write_text('existing')
+        (tmp_path / 'a.txt').write_text('a')
+        (tmp_path / 'a (1).txt').write_text('a (1)')
+        sut = FileLynx(tmp_path)
+
+        # when
+        actual_num = sut.subgroup('ext')
+
+        # then
+        assert actual_num == 0
+        assert {name for name, _, _ in _snapshot(tmp_path)} == {'txt'}
+        moved = {name: (tmp_path / 'txt' / name).read_text() for name, _, _ in _snapshot(tmp_path / 'txt')}
+        assert len(moved) == 3
+        assert moved['a.txt'] == 'existing'
+        assert set(moved.values()) == {'existing', 'a', 'a (1)'}
+
+    def test_subgroup_should_skip_symlink_loop(self, tmp_path):
+        # given
+        (tmp_path / 'a.txt').write_text('a')
+        _make_symlink_or_skip(tmp_path / 'self', tmp_path / 'self')
+        sut = FileLynx(tmp_path)
+
+        # when
+        actual_num = sut.subgroup('ext')
+
+        # then
+        assert actual_num == 1
+        assert set(os.listdir(tmp_path)) == {'txt', 'self'}
+        assert (tmp_path / 'txt' / 'a.txt').read_text() == 'a'
 
 
 class TestFileLynxBatchRename:
@@ -341,171 +394,163 @@ class TestFileLynxBatchRename:
         before = datetime(2022, 10, 5, 15, 29)
         after = datetime(2022, 11, 17, 14, 52)
 
-        # when
-        with pytest.raises(ValueError) as exc_info:
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[before] argument can\'t be less than [after]')):
             sut.batch_rename('somename', before=before, after=after)
 
-        # then
-        assert '[before] argument can\'t be less than [after]' in exc_info.value.args[0]
-
     @pytest.mark.parametrize('sort_by', ['invalid', 'aaBb'])
     def test_batch_rename_should_raise_when_sort_by_is_wrong(self, sort_by, temp_file_dir):
         # given
         sut = FileLynx(temp_file_dir)
 
-        # when
-        with pytest.raises(ValueError) as exc_info:
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[sort_by] argument contains an invalid sorting key')):
             sut.batch_rename('something', sort_by=sort_by)
 
-        # then
-        assert '[sort_by] argument contains an invalid sorting key' in exc_info.value.args[0]
-
     def test_batch_rename_should_raise_when_numerator_start_is_below_zero(self, temp_file_dir):
         # given
         sut = FileLynx(temp_file_dir)
         numerator_start = -1
 
-        # when
-        with pytest.raises(ValueError) as exc_info:
+        # when / then
+        with pytest.raises(ValueError, match=re.escape('[numerator_start] cannot be below zero')):
             sut.batch_rename('something', numerator_start=numerator_start)
 
-        # then
-        assert '[numerator_start] cannot be below zero' in exc_info.value.args[0]
+    @pytest.mark.parametrize('new_name,sep', [('some/name', '_'), ('something', '/')])
+    def test_batch_rename_should_raise_when_name_contains_path_separator(self, temp_file_dir, new_name, sep):
+        # given
+        sut = FileLynx(temp_file_dir)
+
+        # when / then
+        with pytest.raises(ValueError,
+                           match=re.escape('[new_name] and [sep] arguments cannot contain path separators')):
+            sut.batch_rename(new_name, sep=sep)
 
-    def test_batch_rename_should_rename_files(self, temp_file_dir, temp_dir_meta):
+    def test_batch_rename_should_rename_files(self, temp_file_dir):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         expected_names = {f'{new_name}_{i}' for i in range(1, size + 1)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize('sep', [' - ', '#', 'aa'])
-    def test_batch_rename_should_rename_correctly_when_sep_given(self, temp_file_dir, temp_dir_meta, sep):
+    def test_batch_rename_should_rename_correctly_when_sep_given(self, temp_file_dir, sep):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         expected_names = {f'{new_name}{sep}{i}' for i in range(1, size + 1)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, sep=sep)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize('n_start', [0, 14])
-    def test_batch_rename_should_rename_files_correctly_when_numerator_start_given(self, temp_file_dir,
-                                                                                   temp_dir_meta, n_start):
+    def test_batch_rename_should_rename_files_correctly_when_numerator_start_given(self, temp_file_dir, n_start):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         expected_names = {f'{new_name}_{i}' for i in range(n_start, n_start + size)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, numerator_start=n_start)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
-    def test_batch_rename_should_rename_files_correctly_when_numerator_first(self, temp_file_dir, temp_dir_meta):
+    def test_batch_rename_should_rename_files_correctly_when_numerator_first(self, temp_file_dir):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         expected_names = {f'{i}_{new_name}' for i in range(1, 1 + size)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, numerator_first=True)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize('pad', [-1, -2])
-    def test_batch_rename_should_ignore_padding_if_below_zero(self, temp_file_dir, temp_dir_meta, pad):
+    def test_batch_rename_should_ignore_padding_if_below_zero(self, temp_file_dir, pad):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         expected_names = {f'{new_name}_{i}' for i in range(1, 1 + size)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, zero_pad=pad)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize('pad', [0, 1, 2, 6])
-    def test_batch_rename_should_zero_pad_if_zero_pad_given(self, temp_file_dir, temp_dir_meta, pad):
+    def test_batch_rename_should_zero_pad_if_zero_pad_given(self, temp_file_dir, pad):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
-        expected_names = {f'{new_name}_{str(i).zfill(pad)}' for i in range(1, 1 + size)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
+        size = len(_FILE_NAMES)
+        expected_names = {f'{new_name}_{i:0{pad}d}' for i in range(1, 1 + size)}
+        expected_names.update(_FOLDER_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, zero_pad=pad)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize("ext_filter", [['jPG'], ['tXT', 'pdf'], ['jpg', 'dummyext']])
-    def test_batch_rename_should_rename_only_specified_extensions(self, temp_file_dir, temp_dir_meta, ext_filter):
+    def test_batch_rename_should_rename_only_specified_extensions(self, temp_file_dir, ext_filter):
         # given
         new_name = 'something'
-        ext_filter_lowercase = [ef.lower() for ef in ext_filter]
-        size = len([c for c in temp_dir_meta if c[3] == 'file' and c[1] in ext_filter_lowercase])
+        ext_filter_lowercase = frozenset(ef.lower() for ef in ext_filter)
+        size = sum(1 for c in _DIR_META if c[3] == 'file' and c[1] in ext_filter_lowercase)
         expected_names = {f'{new_name}_{i}' for i in range(1, 1 + size)}
-        expected_names.update([c[0] for c in temp_dir_meta if c[3] == 'folder'])
-        expected_names.update([c[0] for c in temp_dir_meta if c[1] not in ext_filter_lowercase and c[3] == 'file'])
+        expected_names.update(_FOLDER_NAMES)
+        expected_names.update(c[0] for c in _DIR_META if c[3] == 'file' and c[1] not in ext_filter_lowercase)
         sut = FileLynx(temp_file_dir)
 
         # when
         num_renamed = sut.batch_rename(new_name, extension_filter=ext_filter)
 
         # then
-        actual_names = set(child.stem for child in temp_file_dir.iterdir())
-        assert expected_names.issubset(actual_names)
-        assert actual_names.issubset(expected_names)
+        actual_names = {os.path.splitext(name)[0] for name, _, _ in _snapshot(temp_file_dir)}
+        assert actual_names == expected_names
         assert num_renamed == size
 
     @pytest.mark.parametrize('sort_by,ascending',
                              [('nAMe', False), ('Datetime', True), ('datetime', False), ('siZE', False)])
-    def test_batch_rename_should_rename_in_correct_order_when_sort_by_given(self, temp_file_dir, temp_dir_meta,
-                                                                            sort_by, ascending):
+    def test_batch_rename_should_rename_in_correct_order_when_sort_by_given(self, temp_file_dir, sort_by, ascending):
         # given
         new_name = 'something'
-        size = len([c for c in temp_dir_meta if c[3] == 'file'])
+        size = len(_FILE_NAMES)
         sut = FileLynx(temp_file_dir)
 
         # when
@@ -513,8 +558,9 @@ class TestFileLynxBatchRename:
 
         # then
         assert num_renamed == size
-        renamed_files = [c for c in temp_file_dir.iterdir() if c.is_file()]
-        renamed_files_sorted = sorted(renamed_files, key=lambda e: e.stem, reverse=not ascending)
+        with os.scandir(temp_file_dir) as it:
+            renamed_files = [entry for entry in it if entry.is_file()]
+        renamed_files_sorted = sorted(renamed_files, key=lambda e: os.path.splitext(e.name)[0], reverse=not ascending)
         direction = 1 if ascending else -1
         for i in range(0, len(renamed_files_sorted) - 1, direction):
             if sort_by.lower() == 'size':
@@ -522,6 +568,89 @@ class TestFileLynxBatchRename:
             elif sort_by.lower() == 'datetime':
                 assert renamed_files_sorted[i].stat().st_mtime <= renamed_files_sorted[i + 1].stat().st_mtime
 
+    def test_batch_rename_should_add_counter_when_target_name_exists(self, tmp_path):
+        # given
+        (tmp_path / 'a.txt').write_text('a')
+        (tmp_path / 'something_1.txt').write_text('existing')
+        (tmp_path / 'something_2.pdf').mkdir()
+        (tmp_path / 'b.pdf').write_text('b')
+        sut = FileLynx(tmp_path)
+
+        # when
+        num_renamed = sut.batch_rename('something', sort_by='name')
+
+        # then
+        assert num_renamed == 3
+        assert {name for name, _, _ in _snapshot(tmp_path)} == {'something_1 (1).txt', 'something_2 (2).pdf',
+                                                                'something_3.txt', 'something_2.pdf'}
+        assert (tmp_path / 'something_1 (1).txt').read_text() == 'a'
+        assert (tmp_path / 'something_2 (2).pdf').read_text() == 'b'
+        assert (tmp_path / 'something_3.txt').read_text() == 'existing'
+        assert (tmp_path / 'something_2.pdf').is_dir()
+
+    @pytest.mark.parametrize('freed_name', ['something_2.txt', 'Something_2.txt'], ids=['same_case', 'other_case'])
+    def test_batch_rename_should_rename_serially_when_target_was_freed_by_earlier_rename(self, tmp_path, monkeypatch,
+                                                                                         freed_name):
+        # given
+        (tmp_path / freed_name).write_text('first')
+        (tmp_path / 'zzz.txt').write_text('second')
+        sut = FileLynx(tmp_path)
+
+        def no_thread_pool(*args, **kwargs):
+            raise AssertionError('an order-dependent plan must not be renamed concurrently')
+
+        monkeypatch.setattr('app.filelynx.ThreadPoolExecutor', no_thread_pool)
+
+        # when
+        num_renamed = sut.batch_rename('something', sort_by='name')
+
+        # then
+        assert num_renamed == 2
+        assert {name for name, _, _ in _snapshot(tmp_path)} == {'something_1.txt', 'something_2.txt'}
+        assert (tmp_path / 'something_1.txt').read_text() == 'first'
+        assert (tmp_path / 'something_2.txt').read_text() == 'second'
+
+    def test_batch_rename_should_keep_suffixes_like_path_suffix(self, tmp_path):
+        # given
+        (tmp_path / '..foo').write_text('..foo')
+        (tmp_path / 'bar.').write_text('bar.')
+        sut = FileLynx(tmp_path)
+
+        # when
+        num_renamed = sut.batch_rename('x', sort_by='name')
+
+        # then
+        assert num_renamed == 2
+        assert (tmp_path / 'x_1.foo').read_text() == '..foo'
+        assert (tmp_path / 'x_2').read_text() == 'bar.'
+
+    def test_batch_rename_should_skip_symlink_loop(self, tmp_path):
+        # given
+        (tmp_path / 'a.txt').write_text('a')
+        (tmp_path / 'b.txt').write_text('b')
+        _make_symlink_or_skip(tmp_path / 'self', tmp_path / 'self')
+        sut = FileLynx(tmp_path)
+
+        # when
+        num_renamed = sut.batch_rename('x', sort_by='name')
+
+        # then
+        assert num_renamed == 2
+        assert set(os.listdir(tmp_path)) == {'x_1.txt', 'x_2.txt', 'self'}
+
+
+def _snapshot(path: Path | str) -> list[tuple[str, bool, bool]]:
+    """Lists a directory as (name, is_file, is_dir) tuples, using the type information cached by `os.scandir`."""
+    with os.scandir(path) as it:
+        return [(entry.name, entry.is_file(), entry.is_dir()) for entry in it]
+
+
+def _make_symlink_or_skip(target: Path, link: Path):
+    try:
+        os.symlink(target, link)
+    except (OSError, NotImplementedError):
+        pytest.skip('symlinks are not supported here')
+
 
 def _make_dummy_file(base_path: Path | str, filename: str, extension: str, size_in_bytes: int):
     if not isinstance(base_path, Path):
@@ -533,12 +662,45 @@ def _make_dummy_file(base_path: Path | str, filename: str, extension: str, size_
     if not isinstance(extension, str):
         raise TypeError('[extension] parameter must be a str object.')
 
-    random_bytes = bytearray(os.urandom(size_in_bytes))
     file_path = base_path / f'{filename}.{extension}'
-    if file_path.exists():
-        raise RuntimeError(f'Operation cancelled - path {file_path} already exists.')
-    with open(file_path, 'wb') as f:
-        f.write(random_bytes)
+    try:
+        _unchecked_make_file(os.fspath(base_path), filename, extension, size_in_bytes)
+    except FileExistsError:
+        raise RuntimeError(f'Operation cancelled - path {file_path} already exists.') from None
+
+
+def _unchecked_make_file(base_str: str, filename: str, extension: str, size_in_bytes: int):
+    """Creates a sparse file without validating the arguments. Raises FileExistsError if the file already exists."""
+    # tests only look at st_size, so the file is created sparse instead of being filled with data
+    fd = os.open(os.path.join(base_str, f'{filename}.{extension}'), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        try:
+            os.ftruncate(fd, size_in_bytes)
+        except OSError:
+            # some filesystems can't extend a file by truncation - writing the last byte still leaves a hole
+            if size_in_bytes > 0:
+                os.lseek(fd, size_in_bytes - 1, os.SEEK_SET)
+                os.write(fd, b'\0')
+    finally:
+        os.close(fd)
+
+
+def _bulk_make_files(base_path: Path | str, specs: list[tuple[str, str, int]]):
+    """Creates sparse files described by (filename, extension, size_in_bytes) tuples in an existing directory."""
+    base_str = os.fspath(base_path)
+    if sys.platform == 'win32':
+        # file creation latency is high on Windows, so the independent creations are overlapped
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda spec: _unchecked_make_file(base_str, *spec), specs))
+    else:
+        for filename, extension, size_in_bytes in specs:
+            _unchecked_make_file(base_str, filename, extension, size_in_bytes)
+
+
+def _bulk_make_folders(base_path: Path | str, folder_names: list[str]):
+    base_str = os.fspath(base_path)
+    for folder_name in folder_names:
+        _unchecked_make_folder(base_str, folder_name)
 
 
 def _make_dummy_folder(base_path: Path | str, folder_name: str):
@@ -550,4 +712,12 @@ def _make_dummy_folder(base_path: Path | str, folder_name: str):
         raise TypeError('[folder_name] parameter must be a str object.')
 
     dir_to_create = base_path / folder_name
-    dir_to_create.mkdir(parents=True, exist_ok=True)
+    try:
+        _unchecked_make_folder(os.fspath(base_path), folder_name)
+    except FileExistsError:
+        raise RuntimeError(f'Operation cancelled - path {dir_to_create} already exists.') from None
+
+
+def _unchecked_make_folder(base_str: str, folder_name: str):
+    """Creates a folder without validating the arguments. Raises FileExistsError if the folder already exists."""
+    os.mkdir(os.path.join(base_str, folder_name))